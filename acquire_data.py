@@ -1,87 +1,141 @@
-import json
 import os
 import random
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import datasets
+import ijson
+import orjson
 
 
-def acquire_data(data_dir):
+def _clone_od(od_eval_dir):
     # OpenDevin data
-    od_eval_dir = os.path.join(data_dir, "od_eval")
-    if not os.path.exists(od_eval_dir):
-        os.makedirs(od_eval_dir, exist_ok=True)
-        subprocess.run(
-            [
-                "git",
-                "clone",
-                "https://huggingface.co/spaces/OpenDevin/evaluation",
-                od_eval_dir,
-            ],
-            check=True,
-        )
-        subprocess.run(["git", "lfs", "pull"], cwd=od_eval_dir, check=True)
-    else:
-        print(f"Directory {od_eval_dir} already exists. Skipping cloning.")
+    os.makedirs(od_eval_dir, exist_ok=True)
+    subprocess.run(
+        [
+            "git",
+            "clone",
+            "--depth=1",
+            "--recurse-submodules",
+            "--jobs=8",
+            "https://huggingface.co/spaces/OpenDevin/evaluation",
+            od_eval_dir,
+        ],
+        check=True,
+    )
+    subprocess.run(["git", "lfs", "pull"], cwd=od_eval_dir, check=True)
+
+
+def _clone_swe(swe_eval_dir):
     # SWE-Bench leaderboard data
-    swe_eval_dir = os.path.join(data_dir, "swe_eval")
-    if not os.path.exists(swe_eval_dir):
-        os.makedirs(swe_eval_dir, exist_ok=True)
-        subprocess.run(
-            [
-                "git",
-                "clone",
-                "https://github.com/swe-bench/experiments.git",
-                swe_eval_dir,
-            ],
-            check=True,
+    os.makedirs(swe_eval_dir, exist_ok=True)
+    # Defer LFS downloads to the restricted `git lfs pull` below; otherwise the
+    # smudge filter fetches every LFS object during checkout.
+    no_smudge_env = {**os.environ, "GIT_LFS_SKIP_SMUDGE": "1"}
+    subprocess.run(
+        [
+            "git",
+            "clone",
+            "--depth=1",
+            "--filter=blob:none",
+            "--sparse",
+            "--recurse-submodules",
+            "--jobs=8",
+            "https://github.com/swe-bench/experiments.git",
+            swe_eval_dir,
+        ],
+        check=True,
+        env=no_smudge_env,
+    )
+    # Only the per-experiment results.json files are read below, so skip the
+    # logs and trajectories that make up most of the repository.
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            swe_eval_dir,
+            "sparse-checkout",
+            "set",
+            "--no-cone",
+            "evaluation/*/*/results/results.json",
+        ],
+        check=True,
+        env=no_smudge_env,
+    )
+    subprocess.run(
+        ["git", "lfs", "pull", "--include=evaluation/**/results/results.json"],
+        cwd=swe_eval_dir,
+        check=True,
+    )
+    # Create a map from id to problem statement using the princeton-nlp/SWE-bench
+    # dataset
+    swe_bench_dataset = datasets.load_dataset("princeton-nlp/SWE-bench")
+    problem_statements = {}
+    for split in ["train", "dev", "test"]:
+        # Read whole Arrow columns instead of materializing a dict per row.
+        split_dataset = swe_bench_dataset[split]
+        problem_statements.update(
+            zip(split_dataset["instance_id"], split_dataset["problem_statement"])
         )
-        subprocess.run(["git", "lfs", "pull"], cwd=swe_eval_dir, check=True)
-        # Create a map from id to problem statement using the princeton-nlp/SWE-bench
-        # dataset
-        swe_bench_dataset = datasets.load_dataset("princeton-nlp/SWE-bench")
-        problem_statements = {}
-        for split in ["train", "dev", "test"]:
-            for data in swe_bench_dataset[split]:
-                problem_statements[data["instance_id"]] = data["problem_statement"]
-        # Convert SWE-bench data to a similar format as OpenDevin
-        for split in ["lite", "test"]:
-            for experiment in os.listdir(
-                os.path.join(swe_eval_dir, "evaluation", split)
-            ):
-                experiment_dir = os.path.join(
-                    swe_eval_dir, "evaluation", split, experiment
+    # Convert SWE-bench data to a similar format as OpenDevin
+    for split in ["lite", "test"]:
+        for experiment in os.listdir(
+            os.path.join(swe_eval_dir, "evaluation", split)
+        ):
+            experiment_dir = os.path.join(
+                swe_eval_dir, "evaluation", split, experiment
+            )
+            all_data = []
+            with open(
+                os.path.join(experiment_dir, "results/results.json"), "rb"
+            ) as f:
+                all_instances = {}
+                # Stream the top-level {result: [instance_ids]} pairs rather
+                # than materializing the whole file.
+                for result, instance_ids in ijson.kvitems(f, ""):
+                    for instance_id in instance_ids:
+                        all_instances[instance_id] = (
+                            1
+                            if result == "resolved"
+                            else all_instances.get(instance_id, 0)
+                        )
+                for instance_id, resolved in all_instances.items():
+                    problem_statement = problem_statements[instance_id]
+                    data = {
+                        "instance_id": instance_id,
+                        "swe_instance": {"problem_statement": problem_statement},
+                        "test_result": {"result": {"resolved": resolved}},
+                    }
+                    all_data.append(data)
+                random.Random(42).shuffle(all_data)
+            with open(
+                os.path.join(experiment_dir, "results/od_results.jsonl"), "wb"
+            ) as f:
+                f.write(
+                    b"".join(
+                        orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+                        for data in all_data
+                    )
                 )
-                all_data = []
-                with open(
-                    os.path.join(experiment_dir, "results/results.json"), "r"
-                ) as f:
-                    json_data = json.load(f)
-                    all_instances = {}
-                    for result, instance_ids in json_data.items():
-                        for instance_id in instance_ids:
-                            all_instances[instance_id] = (
-                                1
-                                if result == "resolved"
-                                else all_instances.get(instance_id, 0)
-                            )
-                    for instance_id, resolved in all_instances.items():
-                        problem_statement = problem_statements[instance_id]
-                        data = {
-                            "instance_id": instance_id,
-                            "swe_instance": {"problem_statement": problem_statement},
-                            "test_result": {"result": {"resolved": resolved}},
-                        }
-                        all_data.append(data)
-                    random.seed(42)
-                    random.shuffle(all_data)
-                with open(
-                    os.path.join(experiment_dir, "results/od_results.jsonl"), "w"
-                ) as f:
-                    for data in all_data:
-                        print(json.dumps(data), file=f)
-    else:
-        print(f"Directory {swe_eval_dir} already exists. Skipping cloning.")
+
+
+def acquire_data(data_dir):
+    od_eval_dir = os.path.join(data_dir, "od_eval")
+    swe_eval_dir = os.path.join(data_dir, "swe_eval")
+    # The clones are network-bound and independent, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = []
+        if not os.path.exists(od_eval_dir):
+            futures.append(executor.submit(_clone_od, od_eval_dir))
+        else:
+            print(f"Directory {od_eval_dir} already exists. Skipping cloning.")
+        if not os.path.exists(swe_eval_dir):
+            futures.append(executor.submit(_clone_swe, swe_eval_dir))
+        else:
+            print(f"Directory {swe_eval_dir} already exists. Skipping cloning.")
+        for future in as_completed(futures):
+            # Re-raise the first failure (e.g. CalledProcessError from git).
+            future.result()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,19 @@ import json
 import os
 import re
 
+import orjson
+
+_RESOLVED_INSTANCE_RE = re.compile(r'- \[(.*?)\]')
+
+
+def _loads(line):
+    # orjson is much faster, but rejects NaN and escaped lone surrogates that
+    # Python's json.dumps emits by default, so fall back to the stdlib parser.
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return json.loads(line)
+
 
 def extract_conversation(history):
     conversation = []
@@ -37,24 +50,26 @@ def load_data(file_path):
     
     # Try to load report.json first
     if os.path.exists(report_json_path):
-        with open(report_json_path, 'r') as report_file:
+        with open(report_json_path, 'rb') as report_file:
             for line in report_file:
-                entry = json.loads(line)
+                entry = _loads(line)
                 resolved_map[entry['instance_id']] = entry['test_result']['report']['resolved']
     elif os.path.exists(report_md_path):
         # If report.json doesn't exist, parse the markdown file
         with open(report_md_path, 'r') as md_file:
             content = md_file.read()
-            resolved_instances = re.findall(r'- \[(.*?)\]', content.split('## Resolved Instances')[1].split('##')[0])
+            _, _, rest = content.partition('## Resolved Instances')
+            section, _, _ = rest.partition('##')
+            resolved_instances = _RESOLVED_INSTANCE_RE.findall(section)
             for instance in resolved_instances:
                 resolved_map[instance] = True
     else:
         print(f"Warning: No report file found for {base_name}")
 
     # Load conversation data
-    with open(file_path, 'r') as file:
+    with open(file_path, 'rb') as file:
         for line in file:
-            data = json.loads(line)
+            data = _loads(line)
             instance_id = data.get('instance_id')
             problem_statement = data.get('instance', {}).get('problem_statement')
             
@@ -81,18 +96,20 @@ def load_data_aider_bench(file_path):
     data_list = []
     directory_name = os.path.dirname(file_path)
     print('Directory name: ', directory_name)
-    with open(file_path, 'r') as file:
+    with open(file_path, 'rb') as file:
         for line in file:
-            data = json.loads(line)
+            data = _loads(line)
             instance_id = data.get('instance_id')
             test_result = data.get('test_result', {})
+            test_cases = test_result.get('test_cases')
+            # Resolved when every test case passed, i.e. the summary is all dots
             resolved = (
                 1
                 if test_result.get('exit_code') == 0
-                and bool(re.fullmatch(r'\.+', test_result.get('test_cases')))
+                and test_cases
+                and not test_cases.strip('.')
                 else 0
             )
-            test_cases = test_result.get('test_cases')
             instruction = data.get('instruction')
             tests = data.get('instance', {}).get('test')
             agent_trajectory = []
@@ -113,9 +130,9 @@ def load_data_aider_bench(file_path):
 
 
 def get_model_name_aider_bench(file_path):
-    with open(file_path, 'r') as file:
+    with open(file_path, 'rb') as file:
         first_line = file.readline()
-        data = json.loads(first_line)
+        data = _loads(first_line)
         return (
             data.get('metadata', {}).get('llm_config', {}).get('model').split('/')[-1]
         )
@@ -2,6 +2,12 @@
 Convert the current SWE-bench leaderboard to a Zeno project.
 """
 
+import os
+import pickle
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
@@ -11,6 +17,57 @@ from swe_bench.models import Split, Dataset, Evaluation
 from swe_bench.utilities import get_all_entries
 
 
+def fetch_evaluation(split: Split, entry: str, cache_dir: str | None = None) -> Evaluation:
+    """
+    Download the evaluation for an entry, reusing a pickled copy from `cache_dir` if given.
+    """
+    if cache_dir is None:
+        return Evaluation.from_github(split, entry)
+
+    cache_path = os.path.join(cache_dir, str(split), f"{entry}.pkl")
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+
+    system = Evaluation.from_github(split, entry)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Write to a temporary file first so a partial pickle is never read back.
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(system, f)
+    os.replace(tmp_path, cache_path)
+    return system
+
+
+def iter_evaluations(
+    split: Split, entries: list[str], cache_dir: str | None = None
+) -> Iterator[tuple[str, Evaluation]]:
+    """
+    Download the evaluations for all entries concurrently, yielding them in entry order
+    and skipping any that fail to load.
+    """
+    # Each download is network-bound, so threads overlap the round trips.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = deque(
+            (entry, executor.submit(fetch_evaluation, split, entry, cache_dir))
+            for entry in entries
+        )
+        try:
+            while futures:
+                # Pop so consumed evaluations can be freed.
+                entry, future = futures.popleft()
+                try:
+                    system = future.result()
+                except ValueError as e:
+                    print(f"Skipping {entry}: {e}")
+                    continue
+                yield entry, system
+        finally:
+            # Don't start queued downloads if the caller stops early or fails.
+            for _, future in futures:
+                future.cancel()
+
+
 @click.command()
 @click.option(
     "--split",
@@ -20,7 +77,15 @@ from swe_bench.utilities import get_all_entries
 )
 @click.option("--zeno-api-key", type=str, envvar="ZENO_API_KEY")
 @click.option("--top-n", type=int, default=None, help="Only include top N systems")
-def main(split: Split, zeno_api_key: str | None, top_n: int | None) -> None:
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse downloaded evaluations across runs (may miss leaderboard updates)",
+)
+def main(
+    split: Split, zeno_api_key: str | None, top_n: int | None, cache_dir: str | None
+) -> None:
     """
     Convert the current leaderboard entries to a Zeno project.
     """
@@ -63,29 +128,29 @@ def main(split: Split, zeno_api_key: str | None, top_n: int | None) -> None:
 
     # Get entries for the split
     entries = get_all_entries(split)
-    
+    evaluations = iter_evaluations(split, entries, cache_dir)
+
     # Sort by resolve rate and take top N if specified
     if top_n is not None:
+        # Ranking needs every evaluation, so wait for all downloads first.
+        systems = dict(evaluations)
+
         # Get resolve rates for sorting
-        resolve_rates = {}
-        for entry in entries:
-            try:
-                system = Evaluation.from_github(split, entry)
-                resolve_rates[entry] = len(system.results.resolved) / len(system.predictions)
-            except ValueError as e:
-                print(f"Skipping {entry} during sorting: {e}")
-                continue
-        
+        resolve_rates = {
+            entry: len(system.results.resolved) / len(system.predictions)
+            for entry, system in systems.items()
+        }
+
         # Sort and take top N
-        entries = sorted(resolve_rates.keys(), key=lambda e: resolve_rates[e], reverse=True)[:top_n]
+        top_entries = sorted(
+            (entry for entry in entries if entry in systems),
+            key=lambda e: resolve_rates[e],
+            reverse=True,
+        )[:top_n]
+        evaluations = ((entry, systems[entry]) for entry in top_entries)
 
-    for entry in entries:
+    for entry, system in evaluations:
         print(f"Processing system {entry}...")
-        try:
-            system = Evaluation.from_github(split, entry)
-        except ValueError as e:
-            print(f"Skipping {entry}: {e}")
-            continue
 
         data = pd.DataFrame(
             [
@@ -45,6 +45,38 @@ class TestVisualization(unittest.TestCase):
         self.assertEqual(data[1][2], 0)
         self.assertEqual(len(data[1][3]), 2)
 
+    def test_load_data_nonstandard_json(self):
+        # NaN and escaped lone surrogates are valid for Python's json module
+        # but rejected by orjson
+        nonstandard_file = os.path.join(self.test_data_dir, 'test_nonstandard_output.jsonl')
+        data = load_data(nonstandard_file)
+        self.assertEqual(len(data), 2)
+
+        self.assertEqual(data[0][0], "test-instance-1")
+        self.assertEqual(data[0][2], 1)
+        self.assertEqual(data[0][3][1]['content'], "Truncated output: \ud800")
+        self.assertEqual(data[1][0], "test-instance-2")
+        self.assertEqual(data[1][2], 0)
+
+    def test_load_data_markdown_report(self):
+        md_file = os.path.join(self.test_data_dir, 'test_md_output.jsonl')
+        data = load_data(md_file)
+        self.assertEqual(len(data), 2)
+
+        # Only instances listed under "Resolved Instances" count as resolved
+        self.assertEqual(data[0][0], "test-instance-1")
+        self.assertEqual(data[0][2], 0)
+        self.assertEqual(data[1][0], "test-instance-2")
+        self.assertEqual(data[1][2], 1)
+
+    def test_load_data_markdown_report_without_resolved_section(self):
+        md_file = os.path.join(self.test_data_dir, 'test_md_no_resolved_output.jsonl')
+        data = load_data(md_file)
+        self.assertEqual(len(data), 2)
+
+        # A report with no "Resolved Instances" heading resolves nothing
+        self.assertEqual([x[2] for x in data], [0, 0])
+
     @patch.dict('os.environ', {'Zeno_Key': 'test_key'})
     @patch('zeno_client.ZenoClient')
     def test_visualise_swe_bench(self, mock_zeno_client):
@@ -44,7 +44,7 @@ def visualise_swe_bench(input_files: list[str]):
         },
         index=ids,
     )
-    df_data['statement_length'] = df_data['problem_statement'].apply(len)
+    df_data['statement_length'] = df_data['problem_statement'].str.len()
     df_data['repo'] = df_data['id'].str.rsplit('-', n=1).str[0]
 
     # Create project with proper view specification
@@ -163,7 +163,7 @@ def visualize_aider_bench(input_files: list[str]):
         },
         index=ids,
     )
-    df_data["instruction_length"] = df_data["instruction"].apply(len)
+    df_data["instruction_length"] = df_data["instruction"].str.len()
     #df_data["repo"] = df_data["id"].str.rsplit("-", n=1).str[0]
     vis_project = vis_client.create_project(
         name="Aider Bench Code Editing Visualization",
@@ -189,17 +189,21 @@ def visualize_aider_bench(input_files: list[str]):
         output = [''] * len(data[0])
         resolved = [0] * len(data[0])
         for entry in data_entry:
-            resolved[id_map[entry[0]]] = entry[2]
-            output[id_map[entry[0]]] += f'## Resolved\n {entry[2]} \n ## Test Cases\n {entry[3]}\n'
-            output[id_map[entry[0]]] += f'## Tests\n {entry[4]}\n ## Agent Trajectory\n'
-            for i in range(len(entry[5])):
-                output[id_map[entry[0]]] += f'### Step {i+1} \n'
-                output[id_map[entry[0]]] += f'Action: {entry[5][i]["action"]}\n'
-                output[id_map[entry[0]]] += f'Code: {entry[5][i]["code"]}\n'
-                output[id_map[entry[0]]] += f'Thought: {entry[5][i]["thought"]}\n'
-                output[id_map[entry[0]]] += f'Observation: {entry[5][i]["observation"]}\n'
-
-
+            idx = id_map[entry[0]]
+            resolved[idx] = entry[2]
+            # Collect the markdown pieces and join once rather than growing
+            # the output string step by step.
+            parts = [
+                f'## Resolved\n {entry[2]} \n ## Test Cases\n {entry[3]}\n',
+                f'## Tests\n {entry[4]}\n ## Agent Trajectory\n',
+            ]
+            for i, step in enumerate(entry[5]):
+                parts.append(f'### Step {i+1} \n')
+                parts.append(f'Action: {step["action"]}\n')
+                parts.append(f'Code: {step["code"]}\n')
+                parts.append(f'Thought: {step["thought"]}\n')
+                parts.append(f'Observation: {step["observation"]}\n')
+            output[idx] += ''.join(parts)
 
         df_system = pd.DataFrame(
             {